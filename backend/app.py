@@ -10,16 +10,38 @@ Features:
 
 from flask import Flask, request, jsonify, send_file
 from flask_cors import CORS
-from scraper import WebScraper
+import requests
+from requests.adapters import HTTPAdapter, Retry
+from scraper import WebScraper, compile_selector
+import atexit
 import json
 import os
+import queue
 import sqlite3
+import time
 from datetime import datetime
 import traceback
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import count
 from typing import Dict, Optional
 import logging
 
+# Optional: orjson serializes large result payloads 3-5x faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: transparent gzip/brotli compression of JSON responses
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
 # Setup logging first
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,6 +49,27 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
 
+if COMPRESS_AVAILABLE:
+    # Scrape results are highly repetitive JSON; compressing cuts bytes on
+    # the wire 5-10x for clients that send Accept-Encoding
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    Compress(app)
+
+if ORJSON_AVAILABLE:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson's C serializer"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
 # Configure folders
 UPLOAD_FOLDER = 'uploads'
 OUTPUT_FOLDER = 'output'
@@ -34,10 +77,27 @@ HISTORY_DB = 'scraping_history.db'
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(OUTPUT_FOLDER, exist_ok=True)
 
+# Per-thread connection cache for the history database.
+# Opening a fresh connection per call pays journal setup on every statement;
+# reusing one per thread keeps the WAL file mapped and the page cache warm.
+_history_local = threading.local()
+
+def get_history_conn() -> sqlite3.Connection:
+    """Get (or open) this thread's connection to the history database"""
+    conn = getattr(_history_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(HISTORY_DB, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        _history_local.conn = conn
+    return conn
+
 # Initialize history database
 def init_history_db():
     """Initialize scraping history database"""
-    conn = sqlite3.connect(HISTORY_DB)
+    conn = get_history_conn()
     cursor = conn.cursor()
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS scraping_history (
@@ -52,20 +112,162 @@ def init_history_db():
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     ''')
+    # Covering index so history listing reads newest-first straight off the
+    # index instead of scanning and sorting the whole table. id breaks ties
+    # between rows sharing a second-granularity created_at (the write-behind
+    # batcher routinely inserts several rows per second).
+    cursor.execute('DROP INDEX IF EXISTS idx_history_created')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_history_created_id
+        ON scraping_history(created_at DESC, id DESC)
+    ''')
     conn.commit()
-    conn.close()
 
 init_history_db()
 
-# Store active scraping jobs
+# Write-behind queue for history inserts. Rows are coalesced and committed
+# in batched transactions so one fsync is amortized over many scrapes
+# instead of paying a full transaction per row on the request path.
+history_queue: queue.Queue = queue.Queue()
+_HISTORY_BATCH_SIZE = 64
+_HISTORY_FLUSH_INTERVAL = 0.2  # seconds
+_HISTORY_STOP = object()
+
+_HISTORY_INSERT_SQL = '''
+    INSERT INTO scraping_history
+    (url, config, results_count, images_count, status, error_message, duration)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+def _history_writer():
+    """Drain history_queue and commit rows in batched transactions"""
+    conn = get_history_conn()
+    while True:
+        rows = [history_queue.get()]
+        # Coalesce whatever arrives within the flush window, up to batch size
+        deadline = time.monotonic() + _HISTORY_FLUSH_INTERVAL
+        while len(rows) < _HISTORY_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                rows.append(history_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        stop = _HISTORY_STOP in rows
+        rows = [r for r in rows if r is not _HISTORY_STOP]
+
+        if rows:
+            try:
+                cursor = conn.cursor()
+                cursor.execute('BEGIN')
+                cursor.executemany(_HISTORY_INSERT_SQL, rows)
+                cursor.execute('COMMIT')
+            except Exception as e:
+                logger.error(f"Error writing history batch: {e}")
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+
+        for _ in range(len(rows) + (1 if stop else 0)):
+            history_queue.task_done()
+
+        if stop:
+            break
+
+_history_writer_thread = threading.Thread(
+    target=_history_writer, name='history-writer', daemon=True
+)
+_history_writer_thread.start()
+
+def _flush_history_queue():
+    """Flush pending history rows on shutdown"""
+    history_queue.put(_HISTORY_STOP)
+    _history_writer_thread.join(timeout=5)
+
+atexit.register(_flush_history_queue)
+
+# Store active scraping jobs. Mutated from both request threads and the
+# scraper pool, so every access goes through jobs_lock; finished jobs are
+# evicted after JOB_TTL seconds so long-running servers don't accumulate
+# result payloads forever.
 active_jobs: Dict[str, Dict] = {}
+jobs_lock = threading.RLock()
+JOB_TTL = 3600  # seconds to keep finished jobs around
+MAX_JOBS = 4096
+
+def _evict_stale_jobs():
+    """Drop finished jobs past their TTL (called with jobs_lock held)"""
+    now = time.time()
+    stale = [
+        job_id for job_id, job in active_jobs.items()
+        if job.get('status') in ('completed', 'failed')
+        and now - job.get('finished_at', now) > JOB_TTL
+    ]
+    # Under extreme churn also cap total tracked jobs, oldest first
+    if len(active_jobs) - len(stale) > MAX_JOBS:
+        overflow = len(active_jobs) - len(stale) - MAX_JOBS
+        for job_id in list(active_jobs):
+            if overflow <= 0:
+                break
+            if job_id not in stale:
+                stale.append(job_id)
+                overflow -= 1
+    for job_id in stale:
+        active_jobs.pop(job_id, None)
+
+# Shared HTTP session for selector testing and URL validation. Pooled
+# connections keep TCP+TLS handshakes alive across requests to the same
+# origin - the common case when a user iteratively refines a selector.
+http = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=1, backoff_factor=0.1)
+)
+http.mount('https://', _adapter)
+http.mount('http://', _adapter)
+http.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+
+# Bounded worker pool for background scraping jobs.
+# Reusing a fixed pool avoids per-request thread creation (~8MB stack each)
+# and queues excess jobs instead of oversubscribing the CPU under bursts.
+executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='scraper')
+
+# Monotonic job-id generator. strftime-based ids collide when two requests
+# land in the same microsecond; a nanosecond timestamp plus process-wide
+# counter is unique and cheaper to produce.
+_job_seq = count()
+
+def new_job_id() -> str:
+    """Generate a collision-free job id"""
+    return f"{time.time_ns():x}-{next(_job_seq):x}"
 
 def progress_callback(job_id: str):
-    """Create progress callback for a job"""
+    """
+    Create progress callback for a job
+
+    Updates are throttled to ~10 Hz: the scraper can report progress per
+    page/item, but the HTTP API only polls every second or so, so writing
+    (and locking) on every report just thrashes jobs_lock. The final
+    update is always flushed so clients see 100%.
+    """
+    last_write = [0.0]
+
     def callback(progress: Dict):
-        if job_id in active_jobs:
-            active_jobs[job_id]['progress'] = progress
-            active_jobs[job_id]['last_update'] = datetime.now().isoformat()
+        now = time.monotonic()
+        is_final = progress.get('current') == progress.get('total')
+        if not is_final and now - last_write[0] < 0.1:
+            return
+        last_write[0] = now
+        with jobs_lock:
+            if job_id in active_jobs:
+                active_jobs[job_id]['progress'] = progress
+                active_jobs[job_id]['last_update'] = datetime.now().isoformat()
     return callback
 
 @app.route('/api/health', methods=['GET'])
@@ -83,7 +285,7 @@ def scrape():
     """
     Main scraping endpoint with enhanced features
     """
-    job_id = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    job_id = new_job_id()
     
     try:
         config = request.json
@@ -101,19 +303,16 @@ def scrape():
             }), 400
         
         # Initialize job tracking
-        active_jobs[job_id] = {
-            'status': 'running',
-            'progress': {'current': 0, 'total': 1},
-            'start_time': datetime.now().isoformat()
-        }
-        
-        # Create progress callback
-        def progress_cb(progress):
-            if job_id in active_jobs:
-                active_jobs[job_id]['progress'] = progress
-        
+        with jobs_lock:
+            _evict_stale_jobs()
+            active_jobs[job_id] = {
+                'status': 'running',
+                'progress': {'current': 0, 'total': 1},
+                'start_time': datetime.now().isoformat()
+            }
+
         # Create scraper instance
-        scraper = WebScraper(config, progress_callback=progress_cb)
+        scraper = WebScraper(config, progress_callback=progress_callback(job_id))
         
         # Run scraping
         start_time = datetime.now()
@@ -125,8 +324,10 @@ def scrape():
         save_to_history(config, scraper, duration, 'success', None)
         
         # Update job status
-        active_jobs[job_id]['status'] = 'completed'
-        active_jobs[job_id]['end_time'] = datetime.now().isoformat()
+        with jobs_lock:
+            active_jobs[job_id]['status'] = 'completed'
+            active_jobs[job_id]['end_time'] = datetime.now().isoformat()
+            active_jobs[job_id]['finished_at'] = time.time()
         
         # Prepare response
         response_data = {
@@ -144,9 +345,12 @@ def scrape():
         return jsonify(response_data)
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        logger.error(f"Error during scraping: {error_trace}")
-        
+        # Formatting the traceback walks every frame and reads source files;
+        # only pay for it (and expose it to clients) in debug mode.
+        # logger.exception defers formatting to the logging subsystem.
+        error_trace = traceback.format_exc() if app.debug else None
+        logger.exception("Error during scraping")
+
         # Save to history if config was available
         try:
             config = request.json if request.json else {}
@@ -155,16 +359,20 @@ def scrape():
             pass
         
         # Update job status
-        if job_id in active_jobs:
-            active_jobs[job_id]['status'] = 'failed'
-            active_jobs[job_id]['error'] = str(e)
+        with jobs_lock:
+            if job_id in active_jobs:
+                active_jobs[job_id]['status'] = 'failed'
+                active_jobs[job_id]['error'] = str(e)
+                active_jobs[job_id]['finished_at'] = time.time()
         
-        return jsonify({
+        error_response = {
             'success': False,
             'job_id': job_id,
-            'error': str(e),
-            'trace': error_trace
-        }), 500
+            'error': str(e)
+        }
+        if error_trace:
+            error_response['trace'] = error_trace
+        return jsonify(error_response), 500
 
 @app.route('/api/scrape-async', methods=['POST'])
 def scrape_async():
@@ -172,7 +380,7 @@ def scrape_async():
     Asynchronous scraping endpoint
     Returns job ID immediately, use /api/job-status to check progress
     """
-    job_id = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    job_id = new_job_id()
     
     try:
         config = request.json
@@ -184,50 +392,54 @@ def scrape_async():
             }), 400
         
         # Initialize job
-        active_jobs[job_id] = {
-            'status': 'queued',
-            'progress': {'current': 0, 'total': 1},
-            'start_time': datetime.now().isoformat(),
-            'config': config
-        }
-        
+        with jobs_lock:
+            _evict_stale_jobs()
+            active_jobs[job_id] = {
+                'status': 'queued',
+                'progress': {'current': 0, 'total': 1},
+                'start_time': datetime.now().isoformat(),
+                'config': config
+            }
+
         # Start scraping in background thread
         def run_scraper():
             try:
-                active_jobs[job_id]['status'] = 'running'
-                
-                def progress_cb(progress):
-                    if job_id in active_jobs:
-                        active_jobs[job_id]['progress'] = progress
-                
-                scraper = WebScraper(config, progress_callback=progress_cb)
+                with jobs_lock:
+                    active_jobs[job_id]['status'] = 'running'
+
+                scraper = WebScraper(config, progress_callback=progress_callback(job_id))
                 start_time = datetime.now()
                 scraper.run()
                 end_time = datetime.now()
                 duration = (end_time - start_time).total_seconds()
-                
-                active_jobs[job_id].update({
-                    'status': 'completed',
-                    'results': scraper.results,
-                    'stats': scraper.stats.to_dict(),
-                    'duration': duration,
-                    'end_time': datetime.now().isoformat()
-                })
-                
+
+                with jobs_lock:
+                    active_jobs[job_id].update({
+                        'status': 'completed',
+                        'results': scraper.results,
+                        'stats': scraper.stats.to_dict(),
+                        'duration': duration,
+                        'end_time': datetime.now().isoformat(),
+                        'finished_at': time.time()
+                    })
+
                 save_to_history(config, scraper, duration, 'success', None)
-                
+
             except Exception as e:
-                active_jobs[job_id].update({
-                    'status': 'failed',
-                    'error': str(e),
-                    'end_time': datetime.now().isoformat()
-                })
+                with jobs_lock:
+                    active_jobs[job_id].update({
+                        'status': 'failed',
+                        'error': str(e),
+                        'end_time': datetime.now().isoformat(),
+                        'finished_at': time.time()
+                    })
                 save_to_history(config, None, 0, 'failed', str(e))
-        
-        thread = threading.Thread(target=run_scraper)
-        thread.daemon = True
-        thread.start()
-        
+
+        # Submit to the shared pool instead of spawning a thread per request
+        future = executor.submit(run_scraper)
+        with jobs_lock:
+            active_jobs[job_id]['future'] = future
+
         return jsonify({
             'success': True,
             'job_id': job_id,
@@ -244,17 +456,27 @@ def scrape_async():
 @app.route('/api/job-status/<job_id>', methods=['GET'])
 def job_status(job_id):
     """Get status of a scraping job"""
-    if job_id not in active_jobs:
+    with jobs_lock:
+        job = active_jobs.get(job_id)
+        job = dict(job) if job is not None else None
+
+    if job is None:
         return jsonify({
             'success': False,
             'error': 'Job not found'
         }), 404
-    
-    job = active_jobs[job_id]
+
+    # Prefer the Future as the source of truth for completion: it also
+    # surfaces exceptions that escaped the worker before the dict was updated
+    future = job.get('future')
+    status = job['status']
+    if future is not None and future.done() and status in ('queued', 'running'):
+        status = 'failed' if future.exception() else 'completed'
+
     return jsonify({
         'success': True,
         'job_id': job_id,
-        'status': job['status'],
+        'status': status,
         'progress': job.get('progress', {}),
         'results': job.get('results'),
         'stats': job.get('stats'),
@@ -311,66 +533,79 @@ def download_results():
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filepath = None
-        
+
+        # Schema shared by the tabular/XML exports, computed once up front:
+        # column order, XML-safe element names, and which columns ever hold
+        # lists (so the per-row loop branches on a dict lookup instead of
+        # isinstance on every value)
+        fieldnames = list(dict.fromkeys(k for item in results for k in item))
+        safe_names = {k: k.replace(' ', '_').replace('-', '_') for k in fieldnames}
+        list_cols = {
+            k for k in fieldnames
+            if any(isinstance(item.get(k), list) for item in results)
+        }
+
+        def flat_rows(sep='|'):
+            """Yield rows with list values joined into strings"""
+            for item in results:
+                yield {
+                    k: (sep.join(str(v) for v in value)
+                        if k in list_cols and isinstance(value, list) else value)
+                    for k, value in item.items()
+                }
+
         if output_format == 'json':
             filename = f'scraped_data_{timestamp}.json'
             filepath = os.path.join(OUTPUT_FOLDER, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-        
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            else:
+                # Write items one at a time instead of serializing the whole
+                # list in memory, so peak RSS stays flat for large result sets
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write('[')
+                    for i, item in enumerate(results):
+                        if i:
+                            f.write(',')
+                        json.dump(item, f, ensure_ascii=False)
+                    f.write(']')
+
         elif output_format == 'csv':
-            import pandas as pd
+            import csv
             filename = f'scraped_data_{timestamp}.csv'
             filepath = os.path.join(OUTPUT_FOLDER, filename)
-            
-            flattened = []
-            for item in results:
-                flat_item = {}
-                for key, value in item.items():
-                    if isinstance(value, list):
-                        flat_item[key] = '|'.join(str(v) for v in value)
-                    else:
-                        flat_item[key] = value
-                flattened.append(flat_item)
-            
-            df = pd.DataFrame(flattened)
-            df.to_csv(filepath, index=False, encoding='utf-8')
+
+            # Stream rows straight to disk via DictWriter; no intermediate
+            # flattened list or DataFrame
+            with open(filepath, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(flat_rows())
         
         elif output_format == 'excel':
             import pandas as pd
             filename = f'scraped_data_{timestamp}.xlsx'
             filepath = os.path.join(OUTPUT_FOLDER, filename)
-            
-            flattened = []
-            for item in results:
-                flat_item = {}
-                for key, value in item.items():
-                    if isinstance(value, list):
-                        flat_item[key] = ', '.join(str(v) for v in value)
-                    else:
-                        flat_item[key] = value
-                flattened.append(flat_item)
-            
-            df = pd.DataFrame(flattened)
+
+            df = pd.DataFrame(flat_rows(sep=', '), columns=fieldnames)
             df.to_excel(filepath, index=False, engine='openpyxl')
         
         elif output_format == 'xml':
-            import xml.etree.ElementTree as ET
+            # lxml builds and serializes the tree in C, several times faster
+            # than stdlib ElementTree on large result sets
+            from lxml import etree as LET
             filename = f'scraped_data_{timestamp}.xml'
             filepath = os.path.join(OUTPUT_FOLDER, filename)
-            
-            root = ET.Element('scraped_data')
-            for item in results:
-                record = ET.SubElement(root, 'record')
+
+            root = LET.Element('scraped_data')
+            for item in flat_rows():
+                record = LET.SubElement(root, 'record')
                 for key, value in item.items():
-                    elem = ET.SubElement(record, key.replace(' ', '_').replace('-', '_'))
-                    if isinstance(value, list):
-                        elem.text = '|'.join(str(v) for v in value)
-                    else:
-                        elem.text = str(value) if value else ''
-            
-            tree = ET.ElementTree(root)
-            tree.write(filepath, encoding='utf-8', xml_declaration=True)
+                    elem = LET.SubElement(record, safe_names[key])
+                    elem.text = str(value) if value else ''
+
+            LET.ElementTree(root).write(filepath, encoding='utf-8', xml_declaration=True)
         
         elif output_format == 'sqlite':
             filename = f'scraped_data_{timestamp}.db'
@@ -378,39 +613,52 @@ def download_results():
             
             conn = sqlite3.connect(filepath)
             cursor = conn.cursor()
-            
+
+            # Throwaway export DB: skip journaling/fsync entirely
+            cursor.execute('PRAGMA journal_mode=MEMORY')
+            cursor.execute('PRAGMA synchronous=OFF')
+
             if results:
                 first_item = results[0]
-                columns = []
-                for key in first_item.keys():
-                    col_name = key.replace(' ', '_').replace('-', '_')
-                    columns.append(f"{col_name} TEXT")
-                
+                keys = list(first_item.keys())
+                cols = [k.replace(' ', '_').replace('-', '_') for k in keys]
+
                 table_name = 'scraped_data'
-                cursor.execute(f"CREATE TABLE {table_name} ({', '.join(columns)})")
-                
-                for item in results:
-                    keys = list(item.keys())
-                    placeholders = ','.join(['?' for _ in keys])
-                    col_names = ','.join([k.replace(' ', '_').replace('-', '_') for k in keys])
-                    values = []
-                    for key in keys:
-                        value = item[key]
-                        if isinstance(value, list):
-                            values.append('|'.join(str(v) for v in value))
-                        else:
-                            values.append(str(value) if value else '')
-                    
-                    cursor.execute(f"INSERT INTO {table_name} ({col_names}) VALUES ({placeholders})", values)
-            
+                cursor.execute(
+                    f"CREATE TABLE {table_name} ({', '.join(f'{c} TEXT' for c in cols)})"
+                )
+
+                # Build the statement once and bulk-insert inside a single
+                # transaction: one fsync for the whole export and no per-row
+                # SQL re-parse
+                sql = f"INSERT INTO {table_name} ({','.join(cols)}) VALUES ({','.join('?' * len(cols))})"
+                rows = (
+                    tuple(
+                        '|'.join(str(v) for v in value) if isinstance(value, list)
+                        else (str(value) if value else '')
+                        for value in (item.get(k) for k in keys)
+                    )
+                    for item in results
+                )
+                cursor.execute('BEGIN')
+                cursor.executemany(sql, rows)
+
             conn.commit()
             conn.close()
         
         if filepath and os.path.exists(filepath):
+            # conditional=True enables Range/If-None-Match handling and lets
+            # the WSGI server push the file through its file_wrapper
+            # (sendfile) path; client retries of an unchanged export get a
+            # zero-byte 304 instead of a full resend
             return send_file(
                 filepath,
                 as_attachment=True,
-                download_name=filename
+                download_name=filename,
+                conditional=True,
+                etag=True,
+                last_modified=os.path.getmtime(filepath),
+                max_age=0
             )
         else:
             return jsonify({'error': 'Failed to create file'}), 500
@@ -421,6 +669,18 @@ def download_results():
             'error': str(e)
         }), 500
 
+@lru_cache(maxsize=1)
+def _html_parser():
+    """
+    Shared lxml HTML parser for selector testing.
+
+    Must be lxml.html's parser, not etree.HTMLParser: only the former
+    yields HtmlElement nodes, which carry the text_content() the preview
+    relies on.
+    """
+    import lxml.html
+    return lxml.html.HTMLParser(remove_comments=True)
+
 @app.route('/api/test-selector', methods=['POST'])
 def test_selector():
     """Test a single selector on a URL"""
@@ -434,26 +694,21 @@ def test_selector():
         if not url or not selector:
             return jsonify({'error': 'URL and selector required'}), 400
         
-        import requests
-        from bs4 import BeautifulSoup
-        from lxml import html as lxml_html
-        
-        response = requests.get(url, timeout=10, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        from lxml import etree
+
+        response = http.get(url, timeout=10)
         response.raise_for_status()
-        
-        if selector_type == 'css':
-            soup = BeautifulSoup(response.content, 'html.parser')
-            elements = soup.select(selector)
-            if attribute:
-                results = [elem.get(attribute, '') for elem in elements[:10]]
-            else:
-                results = [elem.get_text(strip=True) for elem in elements[:10]]
-        else:  # xpath
-            tree = lxml_html.fromstring(response.text)
-            elements = tree.xpath(selector)
-            results = [elem.text_content().strip() if hasattr(elem, 'text_content') 
+
+        # Parse the raw bytes once (lxml handles the decode in C) and run
+        # the selector from the shared compiled-selector cache, so repeated
+        # tests of the same expression skip both parse and compile costs
+        tree = etree.fromstring(response.content, _html_parser())
+        elements = compile_selector(selector_type, selector)(tree)
+
+        if selector_type == 'css' and attribute:
+            results = [elem.get(attribute, '') for elem in elements[:10]]
+        else:
+            results = [elem.text_content().strip() if hasattr(elem, 'text_content')
                       else str(elem).strip() for elem in elements[:10]]
         
         return jsonify({
@@ -470,29 +725,57 @@ def test_selector():
             'error': str(e)
         }), 500
 
+def _check_url(url: str) -> Dict:
+    """HEAD-check a single URL through the shared session"""
+    try:
+        response = http.head(url, timeout=5, allow_redirects=True)
+        return {
+            'url': url,
+            'success': True,
+            'accessible': response.status_code < 400,
+            'status_code': response.status_code,
+            'final_url': response.url,
+            'content_type': response.headers.get('Content-Type', '')
+        }
+    except Exception as e:
+        return {
+            'url': url,
+            'success': False,
+            'accessible': False,
+            'error': str(e)
+        }
+
 @app.route('/api/validate-url', methods=['POST'])
 def validate_url():
-    """Validate if a URL is accessible"""
+    """
+    Validate if one or more URLs are accessible
+
+    Accepts either {'url': '...'} (single result, backward compatible) or
+    {'urls': [...]} which checks the whole batch concurrently.
+    """
     try:
         data = request.json
-        url = data.get('url')
-        
-        if not url:
+        urls = data.get('urls')
+
+        if urls is None:
+            url = data.get('url')
+            if not url:
+                return jsonify({'error': 'URL required'}), 400
+            return jsonify(_check_url(url))
+
+        if not urls:
             return jsonify({'error': 'URL required'}), 400
-        
-        import requests
-        response = requests.head(url, timeout=5, allow_redirects=True, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        
+
+        # Fan the HEAD requests out so a batch completes in ~1 round trip
+        # instead of N sequential ones
+        with ThreadPoolExecutor(max_workers=min(32, len(urls))) as pool:
+            results = list(pool.map(_check_url, urls))
+
         return jsonify({
             'success': True,
-            'accessible': response.status_code < 400,
-            'status_code': response.status_code,
-            'final_url': response.url,
-            'content_type': response.headers.get('Content-Type', '')
+            'results': results
         })
-    
+
     except Exception as e:
         return jsonify({
             'success': False,
@@ -502,36 +785,69 @@ def validate_url():
 
 @app.route('/api/history', methods=['GET'])
 def get_history():
-    """Get scraping history"""
+    """
+    Get scraping history
+
+    Pagination is keyset-based: pass the `next_cursor` value from the
+    previous page as `cursor` to get the next one. O(log n) regardless of
+    how deep you page, unlike OFFSET which re-scans the skipped rows.
+    The legacy `offset` parameter is still honoured for old clients.
+    """
     try:
         limit = request.args.get('limit', 50, type=int)
         offset = request.args.get('offset', 0, type=int)
-        
-        conn = sqlite3.connect(HISTORY_DB)
+        cursor_param = request.args.get('cursor')
+
+        conn = get_history_conn()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM scraping_history 
-            ORDER BY created_at DESC 
-            LIMIT ? OFFSET ?
-        ''', (limit, offset))
-        
+
+        if cursor_param:
+            # Cursor is "<created_at>|<id>". The id tiebreak matters because
+            # created_at has second granularity and batched inserts share a
+            # timestamp: "created_at < ?" alone drops every boundary row.
+            created_cur, _, id_cur = cursor_param.partition('|')
+            if id_cur:
+                cursor.execute('''
+                    SELECT * FROM scraping_history
+                    WHERE created_at < ? OR (created_at = ? AND id < ?)
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT ?
+                ''', (created_cur, created_cur, id_cur, limit))
+            else:
+                # Cursor from an older client without the id component
+                cursor.execute('''
+                    SELECT * FROM scraping_history
+                    WHERE created_at < ?
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT ?
+                ''', (created_cur, limit))
+        else:
+            cursor.execute('''
+                SELECT * FROM scraping_history
+                ORDER BY created_at DESC, id DESC
+                LIMIT ? OFFSET ?
+            ''', (limit, offset))
+
         rows = cursor.fetchall()
         history = [dict(row) for row in rows]
-        
-        cursor.execute('SELECT COUNT(*) as total FROM scraping_history')
-        total = cursor.fetchone()['total']
-        
-        conn.close()
-        
-        return jsonify({
+        next_cursor = (f"{history[-1]['created_at']}|{history[-1]['id']}"
+                       if len(history) == limit else None)
+
+        response = {
             'success': True,
             'history': history,
-            'total': total,
             'limit': limit,
-            'offset': offset
-        })
+            'offset': offset,
+            'next_cursor': next_cursor
+        }
+
+        # COUNT(*) scans the table, so only pay for it on the first page
+        if not cursor_param and offset == 0:
+            cursor.execute('SELECT COUNT(*) as total FROM scraping_history')
+            response['total'] = cursor.fetchone()['total']
+
+        return jsonify(response)
     
     except Exception as e:
         return jsonify({
@@ -543,15 +859,13 @@ def get_history():
 def get_history_item(history_id):
     """Get specific history item"""
     try:
-        conn = sqlite3.connect(HISTORY_DB)
+        conn = get_history_conn()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
-        
+
         cursor.execute('SELECT * FROM scraping_history WHERE id = ?', (history_id,))
         row = cursor.fetchone()
-        
-        conn.close()
-        
+
         if row:
             return jsonify({
                 'success': True,
@@ -571,19 +885,12 @@ def get_history_item(history_id):
 
 def save_to_history(config: Dict, scraper: Optional[WebScraper], 
                    duration: float, status: str, error_message: Optional[str]):
-    """Save scraping job to history"""
+    """Queue scraping job for the history writer (non-blocking)"""
     try:
-        conn = sqlite3.connect(HISTORY_DB)
-        cursor = conn.cursor()
-        
         results_count = len(scraper.results) if scraper else 0
         images_count = len(scraper.images_downloaded) if scraper else 0
-        
-        cursor.execute('''
-            INSERT INTO scraping_history 
-            (url, config, results_count, images_count, status, error_message, duration)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
+
+        history_queue.put((
             config.get('url', ''),
             json.dumps(config),
             results_count,
@@ -592,9 +899,6 @@ def save_to_history(config: Dict, scraper: Optional[WebScraper],
             error_message,
             duration
         ))
-        
-        conn.commit()
-        conn.close()
     except Exception as e:
         logger.error(f"Error saving to history: {e}")
 
@@ -605,9 +909,23 @@ if __name__ == '__main__':
     print("API running at: http://localhost:5000")
     print("Health check: http://localhost:5000/api/health")
     print("="*50)
-    
-    app.run(
-        host='0.0.0.0',
-        port=5000,
-        debug=True
-    )
+
+    if os.getenv('FLASK_DEBUG'):
+        # Werkzeug dev server: auto-reload, but single-threaded - a running
+        # scrape blocks job-status polls
+        app.run(
+            host='0.0.0.0',
+            port=5000,
+            debug=True
+        )
+    else:
+        # Multi-threaded production server so /api/job-status stays
+        # responsive while scrapes are in flight
+        from waitress import serve
+        serve(
+            app,
+            host='0.0.0.0',
+            port=5000,
+            threads=16,
+            connection_limit=200
+        )
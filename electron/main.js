@@ -10,9 +10,11 @@ const BACKEND_PORT = 5000;
 // Determine paths based on environment
 function getBackendPath() {
   if (app.isPackaged) {
-    // Production: Backend executable is in resources
+    // Production: backend/dist is copied to resources/backend (see
+    // extraResources in package.json). PyInstaller --onedir puts the
+    // executable inside its bundle folder, one level down.
     const exeName = process.platform === 'win32' ? 'web-scraper-backend.exe' : 'web-scraper-backend';
-    return path.join(process.resourcesPath, 'backend', exeName);
+    return path.join(process.resourcesPath, 'backend', 'web-scraper-backend', exeName);
   } else {
     // Development: Use Python script
     return path.join(__dirname, '../backend/app.py');